@@ -1,35 +1,67 @@
 import json
-import datetime
+import os
+import sys
+import ijson
+
+def indent_json(value, level):
+    """Serialize value the way json.dump(..., indent=4) would at the given nesting level."""
+    return json.dumps(value, ensure_ascii=False, indent=4).replace('\n', '\n' + ' ' * 4 * level)
 
 print("Loading repository data...")
-with open('results.json', 'r', encoding='utf-8') as file:
-    data = json.load(file)
 
-print(f"Total repositories before filtering: {len(data['items'])}")
+# Top-level keys of results.json, in file order
+with open('results.json', 'rb') as file:
+    keys = [value for prefix, event, value in ijson.parse(file) if prefix == '' and event == 'map_key']
+
+if 'items' not in keys:
+    print("Error: 'items' not found in results.json")
+    sys.exit(1)
 
 # Filter out inactive repositories (last commit before 2015)
-active_repos = []
-inactive_count = 0
-
-for item in data["items"]:
-    created_at = datetime.datetime.strptime(item.get('createdAt', ''), '%Y-%m-%dT%H:%M:%S')
-    last_commit = datetime.datetime.strptime(item.get('lastCommit', ''), '%Y-%m-%dT%H:%M:%S')
-    
-    if last_commit.year >= 2015:
-        active_repos.append(item)
-    else:
-        inactive_count += 1
-        print(f"Removing inactive repo: {item['name']} (last commit: {last_commit.year})")
-
-print(f"\nRepositories removed: {inactive_count}")
-print(f"Active repositories remaining: {len(active_repos)}")
-
-# Update the data with only active repositories
-data["items"] = active_repos
-
-# Write the cleaned results back to the file
-print("Writing cleaned results.json...")
-with open('results.json', 'w', encoding='utf-8') as file:
-    json.dump(data, file, ensure_ascii=False, indent=4)
+total_count = 0
+active_count = 0
+removed_repos = []
+
+try:
+    with open('results.json', 'rb') as file, open('results.json.tmp', 'w', encoding='utf-8') as out:
+        # Copy every key to the temporary file, keeping only the active repositories of 'items'
+        out.write('{')
+        for key_index, key in enumerate(keys):
+            out.write((',' if key_index else '') + '\n    ' + json.dumps(key, ensure_ascii=False) + ': ')
+            file.seek(0)
+            if key != 'items':
+                out.write(indent_json(next(ijson.items(file, key, use_float=True)), 1))
+                continue
+
+            out.write('[')
+            for item in ijson.items(file, 'items.item', use_float=True):
+                total_count += 1
+                # lastCommit is an ISO 8601 timestamp ('%Y-%m-%dT%H:%M:%S'), so the year is its first four characters
+                last_commit_year = int(item['lastCommit'][:4])
+
+                if last_commit_year >= 2015:
+                    out.write((',' if active_count else '') + '\n        ' + indent_json(item, 2))
+                    active_count += 1
+                else:
+                    removed_repos.append(f"Removing inactive repo: {item['name']} (last commit: {last_commit_year})")
+            out.write('\n    ]' if active_count else ']')
+        out.write('\n}')
+
+    print(f"Total repositories before filtering: {total_count}")
+
+    # Report the removed repositories
+    if removed_repos:
+        print("\n".join(removed_repos))
+
+    print(f"\nRepositories removed: {len(removed_repos)}")
+    print(f"Active repositories remaining: {active_count}")
+
+    # Replace results.json with the cleaned results
+    print("Writing cleaned results.json...")
+    os.replace('results.json.tmp', 'results.json')
+finally:
+    # Remove the partial output if writing failed
+    if os.path.exists('results.json.tmp'):
+        os.remove('results.json.tmp')
 
 print("✓ Inactive repositories have been removed from results.json")
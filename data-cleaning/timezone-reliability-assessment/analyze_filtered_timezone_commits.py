@@ -1,37 +1,91 @@
 from git import Repo
 from collections import defaultdict
+from functools import partial
+from multiprocessing import Pool
 import os
 import argparse
 
-parser = argparse.ArgumentParser(description='Creates a CSV containing commit count per day of the week '
-                                              'for a given interval and repository')
-parser.add_argument('start_year', type=int, help='The year commit counting starts')
-parser.add_argument('end_year', type=int, help='The year commit counting stops')
-parser.add_argument('repos', type=str, help='The file containing repository names')
-parser.add_argument('repos_path', type=str, help='The path for the directory that contains the cloned repos')
-args = parser.parse_args()
 
+def parse_arguments():
+    """
+    Parse command-line arguments.
 
-# Read the file and split the lines to get repository names
-with open(args.repos, 'r') as file:
-    repo_list = [line.strip() for line in file.readlines()]
+    Returns:
+        argparse.Namespace: Parsed arguments containing start_year, end_year, repos,
+        repos_path and numprocesses.
+    """
+    parser = argparse.ArgumentParser(description='Creates a CSV containing commit count per day of the week '
+                                                  'for a given interval and repository')
+    parser.add_argument('start_year', type=int, help='The year commit counting starts')
+    parser.add_argument('end_year', type=int, help='The year commit counting stops')
+    parser.add_argument('repos', type=str, help='The file containing repository names')
+    parser.add_argument('repos_path', type=str, help='The path for the directory that contains the cloned repos')
+    parser.add_argument('--numprocesses', type=int, default=os.cpu_count(),
+                        help='The number of repositories processed in parallel (default: number of CPUs)')
+    args = parser.parse_args()
 
-repos_path = args.repos_path
-commits_per_timezone = defaultdict(int)
-for repository in repo_list:
+    if args.numprocesses <= 0:
+        parser.error("Invalid argument: numprocesses must be a positive integer")
+
+    return args
+
+
+def process_repo(repository, repos_path, start_year, end_year):
+    """
+    Count the commits per timezone of a single repository, keeping only the commits of
+    contributors that have already made at least one non-UTC commit.
+
+    Args:
+        repository (str): The repository name.
+        repos_path (str): The path to the directory containing the repositories.
+        start_year (int): The year commit counting starts.
+        end_year (int): The year commit counting stops.
+
+    Returns:
+        dict: The number of commits per timezone offset (e.g. '+0100').
+    """
     print(f"Processing repository: {repository}")
-    non_utc0_commits = defaultdict(bool)
+    commits_per_timezone = defaultdict(int)
+    non_utc0_commits = set()
     repo_path = os.path.join(repos_path, repository)
     repo = Repo(repo_path)
-    commits = repo.iter_commits(reverse=True, since=f"{args.start_year}-01-01", until=f"{args.end_year}-12-31")
-    for commit in commits:
-        contributor = commit.author.email
-        if commit.authored_datetime.strftime('%z') != "+0000":
-            non_utc0_commits[contributor] = True
-
-        if non_utc0_commits[contributor]:
-            timezone = commit.authored_datetime.strftime('%z')
+    # One '<e-mail>\t<timestamp> <+hhmm>' line per commit, oldest first
+    log = repo.git.log('--reverse', f'--since={start_year}-01-01', f'--until={end_year}-12-31',
+                       '--date=raw', '--pretty=format:%ae%x09%ad', as_process=True)
+    for line in log.stdout:
+        contributor, date = line.decode('utf-8', 'replace').rstrip('\n').split('\t')
+        timezone = date[-5:]
+        if timezone != "+0000":
+            non_utc0_commits.add(contributor)
+
+        if contributor in non_utc0_commits:
             commits_per_timezone[timezone] += 1
-with open('commits_per_timezone.txt', 'w') as f:
-    for timezone, count in commits_per_timezone.items():
-        f.write(f"{timezone},{count}\n")
+    log.wait()
+    return dict(commits_per_timezone)
+
+
+def main():
+    """
+    Walk every repository in a pool of worker processes and merge their counts.
+    """
+    args = parse_arguments()
+
+    # Read the file and split the lines to get repository names
+    with open(args.repos, 'r') as file:
+        repo_list = [line.strip() for line in file]
+
+    count_repo = partial(process_repo, repos_path=args.repos_path,
+                         start_year=args.start_year, end_year=args.end_year)
+    commits_per_timezone = defaultdict(int)
+    with Pool(processes=args.numprocesses) as pool:
+        # imap yields the counts in repository order
+        for repo_commits in pool.imap(count_repo, repo_list):
+            for timezone, count in repo_commits.items():
+                commits_per_timezone[timezone] += count
+
+    with open('commits_per_timezone.txt', 'w') as f:
+        f.write("".join(f"{timezone},{count}\n" for timezone, count in commits_per_timezone.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -26,38 +26,36 @@ Finally, it prints and saves the year-wise statistics sorted by year.
 """
 import os
 import numpy as np
-from scipy.stats import entropy
 
 def read_commit_data(file_path):
     with open(file_path, 'r') as file:
-        lines = file.readlines()
-        year = int(lines[0].strip())
+        year = int(next(file).strip())
         timezone_data = {}
-        for line in lines[1:]:
+        for line in file:
             timezone, count = line.strip().split(': ')
             timezone_data[timezone] = int(count)
         return year, timezone_data
 
-def calculate_standard_deviation(timezone_data):
-    counts = list(timezone_data.values())
-    return np.std(counts)
+def calculate_statistics(timezone_data):
+    """
+    Calculate the standard deviation, coefficient of variation, entropy and percentage
+    of UTC+0000 commits of a year's timezone distribution.
 
-def calculate_coefficient_of_variation(timezone_data):
-    counts = list(timezone_data.values())
-    mean = np.mean(counts)
-    std_dev = np.std(counts)
-    return std_dev / mean if mean else 0
+    All four statistics share a single NumPy array of the commit counts.
+    """
+    counts = np.fromiter(timezone_data.values(), dtype=np.int64, count=len(timezone_data))
+    total_commits = counts.sum()
+    if total_commits == 0:
+        return 0.0, 0.0, 0.0, 0
 
-def calculate_entropy(timezone_data):
-    counts = list(timezone_data.values())
-    total_commits = sum(counts)
-    probabilities = [count / total_commits for count in counts if total_commits > 0]
-    return entropy(probabilities)
-
-def calculate_percentage_utc(timezone_data):
-    total_commits = sum(timezone_data.values())
-    commits_utc = timezone_data.get('+0000', 0)
-    return (commits_utc / total_commits) * 100 if total_commits > 0 else 0
+    mean = total_commits / counts.size
+    std_dev = np.sqrt(((counts - mean) ** 2).mean())
+    cv = std_dev / mean
+    # Zero counts contribute nothing to the entropy (0 * log 0 = 0)
+    probabilities = counts[counts > 0] / total_commits
+    ent = (probabilities * np.log(1 / probabilities)).sum()
+    percentage_utc = timezone_data.get('+0000', 0) / total_commits * 100
+    return std_dev, cv, ent, percentage_utc
 
 def main(directory_path):
     year_stats = []
@@ -66,10 +64,7 @@ def main(directory_path):
         if filename.endswith('.txt'):
             file_path = os.path.join(directory_path, filename)
             year, timezone_data = read_commit_data(file_path)
-            std_dev = calculate_standard_deviation(timezone_data)
-            cv = calculate_coefficient_of_variation(timezone_data)
-            ent = calculate_entropy(timezone_data)
-            percentage_utc = calculate_percentage_utc(timezone_data)
+            std_dev, cv, ent, percentage_utc = calculate_statistics(timezone_data)
             year_stats.append((year, std_dev, cv, ent, percentage_utc))
 
     # Sort by year
@@ -84,8 +79,7 @@ def main(directory_path):
     
     # Save to file
     with open(os.path.join(directory_path, "commit_variation_stats.txt"), 'w') as f:
-        for result in results:
-            f.write(result + "\n")
+        f.write("".join(f"{result}\n" for result in results))
 
 if __name__ == "__main__":
     main("commits-data")
\ No newline at end of file
@@ -27,6 +27,10 @@ done
 DATA_LOCATION=$(pwd)
 REPO_LOCATION=/home/repos/github
 
+#temporary file holding one year of a project's log
+year_log=$(mktemp)
+trap 'rm -f "$year_log"' EXIT
+
 for year in ${arguements[@]}; do
 	echo "$year" >> "$DATA_LOCATION/commits_by_timezone_$year.txt"
 	#initialize commits_by_timezone array
@@ -38,10 +42,13 @@ for year in ${arguements[@]}; do
     		dir_name="$REPO_LOCATION/$name"
     		cd "$dir_name" || continue
 
+    		# Save the project's log for the year; a repository git cannot read
+    		# (e.g. an empty clone) counts as no commits
+    		git log --after="$((year-1))-12-31" --before="$((year+1))-01-01" > "$year_log" || true
+
     		# Loop through timezone offsets from -12 to +12
     		for timezone_offset in ${timezones[@]}; do
-    		# Execute git log command with timezone offset
-    		commits_count=$(git log --after="$((year-1))-12-31" --before="$((year+1))-01-01" | grep -- "$timezone_offset" | wc -l)
+    		commits_count=$(grep -- "$timezone_offset" "$year_log" | wc -l)
     		commits_by_timezone["$timezone_offset"]=$(( ${commits_by_timezone["$timezone_offset"]} + commits_count ))
     		echo "$name: $timezone_offset: $commits_count"
     		done 
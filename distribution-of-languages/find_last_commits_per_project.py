@@ -1,18 +1,29 @@
-import json
+import ijson
 from collections import defaultdict
 
-with open("results.json", "r", encoding="utf-8") as file:
-    data = json.load(file)
-
 last_commits_per_project = defaultdict(int)
-active_repos_per_year = defaultdict(int)
+# Difference array of active repositories: +1 in the year a repository was created
+# and -1 in the year after its last commit
+active_repos_deltas = defaultdict(int)
+
+# Read the items of results.json one at a time
+with open("results.json", "rb") as file:
+    for row in ijson.items(file, "items.item", use_float=True):
+        # lastCommit and createdAt are ISO 8601 timestamps, so the year is their first four characters
+        last_commit_year = int(row["lastCommit"][:4])
+        created_at_year = int(row["createdAt"][:4])
+        if created_at_year <= last_commit_year:
+            active_repos_deltas[created_at_year] += 1
+            active_repos_deltas[last_commit_year + 1] -= 1
+        last_commits_per_project[last_commit_year] += 1
 
-for row in data["items"]:
-    last_commit_year = row["lastCommit"].split("-")[0]
-    created_at_year = row["createdAt"].split("-")[0]
-    for year in range(int(created_at_year), int(last_commit_year) + 1):
-        active_repos_per_year[year] += 1
-    last_commits_per_project[last_commit_year] += 1
+# The running sum of the differences is the number of repositories active in each year
+active_repos_per_year = {}
+active_repos = 0
+for year in range(min(active_repos_deltas, default=0), max(active_repos_deltas, default=0)):
+    active_repos += active_repos_deltas[year]
+    if active_repos:
+        active_repos_per_year[year] = active_repos
 
 # Sort the dictionary by year
 last_commits_per_project = dict(sorted(last_commits_per_project.items()))
@@ -21,5 +32,4 @@ number_of_projects = sum(last_commits_per_project.values())
 print(active_repos_per_year)
 
 with open("active_repos_per_year.txt", "w") as f:
-    for year, count in active_repos_per_year.items():
-        f.write(f"{year},{count}\n")
\ No newline at end of file
+    f.write("".join(f"{year},{count}\n" for year, count in active_repos_per_year.items()))
\ No newline at end of file
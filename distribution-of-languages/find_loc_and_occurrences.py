@@ -18,49 +18,35 @@ Output:
 Example Output:
     {'Python': 15, 'JavaScript': 7, 'Java': 3, 'Ruby': 2}
 """
-import json
-from collections import defaultdict
-
-def count_unique_values(list):
-    count_dict = {}
-    for item in list:
-        if item in count_dict:
-            count_dict[item] += 1
-        else:
-            count_dict[item] = 1
-    return count_dict
-
-repos=[]
+import ijson
+from collections import Counter, defaultdict
+from operator import itemgetter
 
 with open("projects-accepted.txt") as file1:
-    lines = file1.readlines()
-    for line in lines:
-        repos.append(line.strip())
+    repos = {line.strip() for line in file1}
 
 loc = defaultdict(int)
-occurance=[]
-
-with open("results.json", encoding="utf-8") as file2:
-    data = json.load(file2)
-
-for row in data["items"]:
-    if row["name"] in repos:
-        language = row["mainLanguage"]
-        if language:
-            loc[language] += 1
-            occurance.append(language)
-        dicts_of_languages = row["metrics"]
-        for lang in dicts_of_languages:
-            loc[lang["language"]] += lang["codeLines"]
+occurance_dict = Counter()
+
+# Read the items of results.json one at a time
+with open("results.json", "rb") as file2:
+    for row in ijson.items(file2, "items.item", use_float=True):
+        if row["name"] in repos:
+            language = row["mainLanguage"]
+            if language:
+                loc[language] += 1
+                occurance_dict[language] += 1
+            dicts_of_languages = row["metrics"]
+            for lang in dicts_of_languages:
+                loc[lang["language"]] += lang["codeLines"]
 
-occurance_dict = count_unique_values(occurance)
 languages = list(occurance_dict.keys())
 for lang in languages:
     if lang not in loc.keys():
         del loc[lang]
 
-sorted_loc = dict(sorted(loc.items(), key=lambda item: item[1], reverse=True))
-sorted_occurance = dict(sorted(occurance_dict.items(), key=lambda item: item[1], reverse=True))
+sorted_loc = dict(sorted(loc.items(), key=itemgetter(1), reverse=True))
+sorted_occurance = dict(sorted(occurance_dict.items(), key=itemgetter(1), reverse=True))
 
 print(sorted_occurance)
 print(sorted_loc)
\ No newline at end of file
@@ -1,19 +1,17 @@
-import json
+import orjson
 
-with open('enterprise_projects.txt', 'r', encoding='utf-8') as file:
-    data = file.readlines()
-projects = [line.strip().split('\t')[0].split('/')[-2:] for line in data]
-projects = [f"{name}/{repo}" for name, repo in projects]
-set_projects = set(projects)
+def read_project_names(filename):
+    """Return the 'owner/repo' names of the GitHub URLs in the first column of a tab-separated file."""
+    with open(filename, 'r', encoding='utf-8') as file:
+        # The URL is the first column; its last two path segments are the owner and repository
+        return {"/".join(line.split('\t', 1)[0].strip().rsplit('/', 2)[-2:]) for line in file}
 
-with open('cohort_project_details.txt', 'r', encoding='utf-8') as file:
-    projects2 = file.readlines()
-projects2 = [line.strip().split('\t')[0].split('/')[-2:] for line in projects2]
-projects2 = [f"{name}/{repo}" for name, repo in projects2]
-set_projects2 = set(projects2)
+set_projects = read_project_names('enterprise_projects.txt')
 
-with open('results.json', 'r', encoding='utf-8') as file:
-    data = json.load(file)
+set_projects2 = read_project_names('cohort_project_details.txt')
+
+with open('results.json', 'rb') as file:
+    data = orjson.loads(file.read())
 
 projects_in_sample = set(item['name'] for item in data['items'])
 
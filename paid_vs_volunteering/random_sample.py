@@ -1,20 +1,33 @@
 """
 This script randomly selects 355 unique repository names and writes the selected names to a text file.
 Steps:
-1. Loads data from 'results.json', expecting a dictionary with an "items" key containing item dictionaries.
+1. Streams 'results.json', expecting a dictionary with an "items" key containing item dictionaries.
 2. Extracts the 'name' field from each item in the "items" list.
-3. Randomly samples 355 unique names from the extracted list.
+3. Randomly samples 355 unique names in the same pass using reservoir sampling.
 4. Writes the sampled names, one per line, to 'random_repos_sample.txt'.
 """
-import json
+import ijson
 import random
 
-with open('results.json', 'r', encoding='utf-8') as file:
-    data = json.load(file)
-    
-items = [item['name'] for item in data["items"]]
-random_sample = random.sample(items, 355)
+SAMPLE_SIZE = 355
+
+# Reservoir sampling (Algorithm R): keep a uniform sample of SAMPLE_SIZE names
+# while reading the 'name' of each item
+random_sample = []
+with open('results.json', 'rb') as file:
+    for index, name in enumerate(ijson.items(file, 'items.item.name')):
+        if index < SAMPLE_SIZE:
+            random_sample.append(name)
+        else:
+            slot = random.randint(0, index)
+            if slot < SAMPLE_SIZE:
+                random_sample[slot] = name
+
+if len(random_sample) < SAMPLE_SIZE:
+    raise ValueError("Sample larger than population")
+
+# The reservoir keeps early items in file order, so shuffle it as random.sample would
+random.shuffle(random_sample)
 
 with open('random_repos_sample.txt', 'w', encoding='utf-8') as file:
-    for item in random_sample:
-        file.write(f"{item}\n")
\ No newline at end of file
+    file.write("".join(f"{item}\n" for item in random_sample))
\ No newline at end of file
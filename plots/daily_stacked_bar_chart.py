@@ -4,22 +4,41 @@ and generates a stacked bar chart showing the number or proportion of commits fo
 The script is designed to visualize how commit activity varies across the selected days over time.
 
 Usage:
-    python daily_stacked_bar_chart.py <filename>
+    python daily_stacked_bar_chart.py <filename> [<filename> ...]
 
 Arguments:
     filename: The name of the CSV file containing the commit data. The CSV file should have periods (e.g., years) as headers 
-              and rows corresponding to different time intervals.
+              and rows corresponding to different time intervals. With several files, the same days are used for all of 
+              them, the charts are drawn on one reused figure and each is saved as <csv name>_daily_stacked_bar_chart.pdf.
 
 The script will prompt the user to input the days of the week they want to analyze, where days are represented as integers 
 (0=Monday, 6=Sunday). A stacked bar chart will then be displayed for the selected days.
 """
 import csv
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import argparse
-from itertools import tee
+import os
 import matplotlib.ticker as mticker
 
+# Style of the chart, applied while it is drawn
+STYLE = {
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'axes.grid.axis': 'y',
+    'axes.axisbelow': True,
+    'grid.linestyle': '--',
+    'grid.linewidth': 0.7,
+    'grid.alpha': 0.7,
+    'ytick.labelsize': 10,
+}
+
+# Size of the chart and the file it is saved to when a single CSV is plotted
+FIGURE = {'figsize': (6.4, 4.8), 'dpi': 100}
+OUTPUT_FILE = 'daily_stacked_bar_chart.pdf'
+
 # Define the days of the week
 days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
@@ -55,18 +74,11 @@ def read_data(filename):
     with open(filename) as csvfile:
         reader = csv.reader(csvfile)
         periods = next(reader)  # Skip header row
-        reader_copy1, reader_copy2 = tee(reader, 2)
-        num_of_periods = len(periods)
-        period = [[] for _ in range(num_of_periods)]
-        all_commits = [[] for _ in range(7)]
-
-        for row in reader_copy1:
-            for i in range(1, len(period)):
-                period[i].append(float(row[i]))
+        # Period columns of the remaining rows
+        data = np.loadtxt(csvfile, delimiter=',', usecols=range(1, len(periods)), ndmin=2)
 
-        for i in range(len(period[1])):
-            for j in range(1, len(period)):
-                all_commits[i % 7].append(period[j][i])
+    # Row i belongs to day i % 7; each day gets its rows' values one after the other
+    all_commits = data.reshape(-1, 7, data.shape[1]).transpose(1, 0, 2).reshape(7, -1)
 
     return periods[1:], all_commits
 
@@ -75,22 +87,33 @@ def prepare_data(all_commits, selected_days):
     Prepare data for the selected days of the week.
 
     Parameters:
-    all_commits (list of lists): The daily commits data.
+    all_commits (numpy array): The daily commits data, one row per day of the week.
     selected_days (list of int): List of selected days of the week (0=Monday, 6=Sunday).
 
     Returns:
     tuple: A tuple containing the data for the selected days and their corresponding labels.
     """
-    data_blocks = []
-    day_labels = []
+    # Rows of the selected days
+    data_blocks = all_commits[selected_days]
+    day_labels = [days[day] for day in selected_days]  # Use the global 'days' list to get the day names
 
-    for day in selected_days:
-        data_blocks.append(all_commits[day])
-        day_labels.append(days[day])  # Use the global 'days' list to get the day names
+    return data_blocks, day_labels
 
-    return np.array(data_blocks), day_labels
+def reset_axes(ax):
+    """
+    Clear a reused axes and give it the chart's style. Must be called inside
+    plt.rc_context(STYLE); spines and axisbelow are only read from rcParams when an
+    axes is created, so they are set here.
 
-def plot_data(data_blocks, day_labels, periods):
+    Parameters:
+    ax (matplotlib Axes): The axes to clear.
+    """
+    ax.cla()
+    ax.spines['top'].set_visible(STYLE['axes.spines.top'])
+    ax.spines['right'].set_visible(STYLE['axes.spines.right'])
+    ax.set_axisbelow(STYLE['axes.axisbelow'])
+
+def plot_data(data_blocks, day_labels, periods, ax=None, output_file=OUTPUT_FILE):
     """
     Plot a stacked bar chart based on the data blocks and day labels.
 
@@ -98,58 +121,65 @@ def plot_data(data_blocks, day_labels, periods):
     data_blocks (numpy array): Array of data blocks.
     day_labels (list of str): List of day labels for the legend.
     periods (list of str): List of period labels.
+    ax (matplotlib Axes, optional): Axes to draw on, cleared first, so that a batch of
+        charts can reuse one figure. A new figure is created if not given.
+    output_file (str): Path of the PDF the chart is saved to.
     """
-    fig, ax = plt.subplots(figsize=(6.4, 4.8), dpi=100)
+    with plt.rc_context(STYLE):
+        if ax is None:
+            fig, ax = plt.subplots(**FIGURE)
+        else:
+            reset_axes(ax)
+            fig = ax.figure
 
-    bottom = np.zeros(len(periods))
+        # Each block is stacked on the running total of the blocks before it
+        bottoms = np.zeros_like(data_blocks)
+        bottoms[1:] = np.cumsum(data_blocks[:-1], axis=0)
     
-    # Use tab10 colormap for professional appearance
-    colors = plt.cm.tab10(np.linspace(0, 1, len(day_labels)))
-
-    for i, data_block in enumerate(data_blocks):
-        ax.bar(range(len(periods)), data_block, bottom=bottom, color=colors[i], 
-               width=0.85, label=day_labels[i], edgecolor='white', linewidth=0.5)
-        bottom += data_block
-
-    ax.set_xlabel('Year', fontsize=12, fontname='DejaVu Serif')
-    ax.set_ylabel('Commits (%)', fontsize=12, fontname='DejaVu Serif')
+        # Use tab10 colormap for professional appearance
+        colors = plt.cm.tab10(np.linspace(0, 1, len(day_labels)))
 
-    ax.set_xticks(range(len(periods)))
-    ax.set_xticklabels(periods, rotation=45, ha='center', fontsize=10, fontname='DejaVu Serif')
+        for i, (data_block, bottom) in enumerate(zip(data_blocks, bottoms)):
+            ax.bar(range(len(periods)), data_block, bottom=bottom, color=colors[i], 
+                   width=0.85, label=day_labels[i], edgecolor='white', linewidth=0.5)
 
-    # Format y-axis as percentages
-    ax.yaxis.set_major_formatter(mticker.PercentFormatter(decimals=0))
-    ax.tick_params(axis='y', labelsize=10)
+        ax.set_xlabel('Year', fontsize=12, fontname='DejaVu Serif')
+        ax.set_ylabel('Commits (%)', fontsize=12, fontname='DejaVu Serif')
 
-    # Professional grid
-    ax.yaxis.grid(True, linestyle='--', linewidth=0.7, alpha=0.7)
-    ax.set_axisbelow(True)
+        ax.set_xticks(range(len(periods)))
+        ax.set_xticklabels(periods, rotation=45, ha='center', fontsize=10, fontname='DejaVu Serif')
 
-    # Clean up spines
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
+        # Format y-axis as percentages
+        ax.yaxis.set_major_formatter(mticker.PercentFormatter(decimals=0))
 
-    # Professional legend
-    ax.legend(fontsize=11, loc='upper left', frameon=True, facecolor='white', 
-              framealpha=1, edgecolor='gray')
+        # Professional legend
+        ax.legend(fontsize=11, loc='upper left', frameon=True, facecolor='white', 
+                  framealpha=1, edgecolor='gray')
 
-    plt.tight_layout()
-    plt.savefig('daily_stacked_bar_chart.pdf', format='pdf', bbox_inches='tight', pad_inches=0.1)
+        fig.tight_layout()
+        fig.savefig(output_file, format='pdf', bbox_inches='tight', pad_inches=0.1)
 
-def main(filename):
+def main(filenames):
     """
     Main function to execute the script workflow.
 
     Parameters:
-    filename (str): The name of the CSV file to process.
+    filenames (list of str): The names of the CSV files to process.
     """
     selected_days = input_days_of_week()
-    periods, all_commits = read_data(filename)
-    data_blocks, day_labels = prepare_data(all_commits, selected_days)
-    plot_data(data_blocks, day_labels, periods)
+    fig, ax = plt.subplots(**FIGURE)
+    for filename in filenames:
+        periods, all_commits = read_data(filename)
+        data_blocks, day_labels = prepare_data(all_commits, selected_days)
+        output_file = OUTPUT_FILE
+        if len(filenames) > 1:
+            output_file = f"{os.path.splitext(os.path.basename(filename))[0]}_{OUTPUT_FILE}"
+        plot_data(data_blocks, day_labels, periods, ax=ax, output_file=output_file)
+    plt.close(fig)
 
 if __name__ == "__main__":
+    matplotlib.use('Agg')  # The charts are only saved to files
     parser = argparse.ArgumentParser(description="A script for creating a stacked bar chart for selected days of the week.")
-    parser.add_argument("filename", help="The CSV file to get the data from")
+    parser.add_argument("filenames", nargs="+", help="The CSV files to get the data from")
     args = parser.parse_args()
-    main(args.filename)
\ No newline at end of file
+    main(args.filenames)
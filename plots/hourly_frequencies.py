@@ -18,70 +18,57 @@ Returns:
 Dependencies:
     - numpy
     - matplotlib
-    - csv
+    - pandas
 
 Example:
     python hourly_frequencies.py ../write-data-in-csv/csv-files/CommitPercentagesPerHour.csv 2015 2024
 """
 
-import csv
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 import sys
 import matplotlib.ticker as mticker
 
+# Style of the chart, applied while it is drawn: every text element uses the serif font
+STYLE = {
+    'font.family': 'DejaVu Serif',
+}
+
 def read_csv_data(filename):
     """
-    Read CSV data and return headers and data dictionary.
+    Read CSV data into a DataFrame.
     
     Parameters:
     filename (str): Path to the CSV file
     
     Returns:
-    tuple: (headers, data_dict) where headers is a list of column names
-           and data_dict maps column names to lists of values
+    pandas.DataFrame: The 'Hour' column as strings and one float column per period
     """
-    data_dict = {}
-    headers = []
-    
-    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        headers = reader.fieldnames
-        
-        # Initialize data dictionary
-        for header in headers:
-            data_dict[header] = []
-        
-        # Read data
-        for row in reader:
-            for header in headers:
-                if header == 'Hour':
-                    data_dict[header].append(row[header])
-                else:
-                    data_dict[header].append(float(row[header]))
-    
-    return headers, data_dict
+    # round_trip parses every value exactly as float() would
+    return pd.read_csv(filename, dtype={'Hour': str}, float_precision='round_trip')
 
-def extract_period_data(data_dict, period1, period2):
+def extract_period_data(df, period1, period2):
     """
     Extract data for two specific periods.
     
     Parameters:
-    data_dict (dict): Dictionary containing all data
+    df (pandas.DataFrame): DataFrame containing all data
     period1 (str): Name of first period
     period2 (str): Name of second period
     
     Returns:
     tuple: (hours, period1_data, period2_data)
     """
-    if period1 not in data_dict:
+    if period1 not in df.columns:
         raise ValueError(f"Period '{period1}' not found in data")
-    if period2 not in data_dict:
+    if period2 not in df.columns:
         raise ValueError(f"Period '{period2}' not found in data")
     
-    hours = data_dict['Hour']
-    period1_data = data_dict[period1]
-    period2_data = data_dict[period2]
+    # Hour labels and the values of the two periods
+    hours = df['Hour'].tolist()
+    period1_data = df[period1].to_numpy(dtype=float)
+    period2_data = df[period2].to_numpy(dtype=float)
     
     return hours, period1_data, period2_data
 
@@ -110,76 +97,67 @@ def create_grouped_bar_chart(hours, period1_data, period2_data, period1_name, pe
     
     Parameters:
     hours (list): Hour labels
-    period1_data (list): Data for first period
-    period2_data (list): Data for second period
+    period1_data (numpy array): Data for first period
+    period2_data (numpy array): Data for second period
     period1_name (str): Name of first period
     period2_name (str): Name of second period
     """
-    # Set up the figure with academic styling
-    fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
-    
-    # Format data
-    x = np.arange(len(hours))
-    width = 0.35
-    
-    # Academic-appropriate colors (colorblind-friendly and print-safe)
-    # Using a deep blue and a warm orange - standard academic palette
-    colors = ['#1f77b4', '#ff7f0e']  # Blue and orange from matplotlib's default cycle
-    
-    # Create bars with academic colors
-    bars1 = ax.bar(x - width/2, period1_data, width, 
-                   label=period1_name, color=colors[0],
-                   edgecolor='white', linewidth=0.5)
-    bars2 = ax.bar(x + width/2, period2_data, width,
-                   label=period2_name, color=colors[1],
-                   edgecolor='white', linewidth=0.5)
-    
-    # Customize axes with academic styling
-    ax.set_xlabel('Hour', fontsize=12, fontname='DejaVu Serif')
-    ax.set_ylabel('Commits (%)', fontsize=12, fontname='DejaVu Serif')
-    
-    # Format x-axis
-    formatted_hours = format_hour_labels(hours)
-    ax.set_xticks(x)
-    ax.set_xticklabels(formatted_hours, fontsize=10, fontname='DejaVu Serif')
-    
-    # Format y-axis
-    ax.tick_params(axis='y', labelsize=10)
-    ax.yaxis.set_major_formatter(mticker.PercentFormatter(decimals=0))
-    
-    # Professional grid
-    ax.yaxis.grid(True, linestyle='--', linewidth=0.7, alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    # Clean up spines
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    
-    # Professional legend
-    legend = ax.legend(fontsize=11, loc='upper left', frameon=True, 
-                      facecolor='white', framealpha=1, edgecolor='gray')
-    
-    # Set font for legend text
-    for text in legend.get_texts():
-        text.set_fontname('DejaVu Serif')
-    
-    # Set tick parameters for academic style
-    for label in ax.get_xticklabels():
-        label.set_fontname('DejaVu Serif')
-    for label in ax.get_yticklabels():
-        label.set_fontname('DejaVu Serif')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    output_filename = f'percentages_per_hour_{period1_name}vs{period2_name}.pdf'
-    plt.savefig(output_filename, format='pdf', bbox_inches='tight', pad_inches=0.1)
-    
-    print(f"Chart saved as: {output_filename}")
-    
-    # Show the plot
-    plt.show()
+    with plt.rc_context(STYLE):
+        # Set up the figure with academic styling
+        fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
+    
+        # Format data
+        x = np.arange(len(hours))
+        width = 0.35
+    
+        # Academic-appropriate colors (colorblind-friendly and print-safe)
+        # Using a deep blue and a warm orange - standard academic palette
+        colors = ['#1f77b4', '#ff7f0e']  # Blue and orange from matplotlib's default cycle
+    
+        # Create bars with academic colors
+        bars1 = ax.bar(x - width/2, period1_data, width, 
+                       label=period1_name, color=colors[0],
+                       edgecolor='white', linewidth=0.5)
+        bars2 = ax.bar(x + width/2, period2_data, width,
+                       label=period2_name, color=colors[1],
+                       edgecolor='white', linewidth=0.5)
+    
+        # Customize axes with academic styling
+        ax.set_xlabel('Hour', fontsize=12)
+        ax.set_ylabel('Commits (%)', fontsize=12)
+    
+        # Format x-axis
+        formatted_hours = format_hour_labels(hours)
+        ax.set_xticks(x)
+        ax.set_xticklabels(formatted_hours, fontsize=10)
+    
+        # Format y-axis
+        ax.tick_params(axis='y', labelsize=10)
+        ax.yaxis.set_major_formatter(mticker.PercentFormatter(decimals=0))
+    
+        # Professional grid
+        ax.yaxis.grid(True, linestyle='--', linewidth=0.7, alpha=0.7)
+        ax.set_axisbelow(True)
+    
+        # Clean up spines
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+    
+        # Professional legend
+        ax.legend(fontsize=11, loc='upper left', frameon=True, 
+                  facecolor='white', framealpha=1, edgecolor='gray')
+    
+        # Adjust layout
+        plt.tight_layout()
+    
+        # Save the figure
+        output_filename = f'percentages_per_hour_{period1_name}vs{period2_name}.pdf'
+        plt.savefig(output_filename, format='pdf', bbox_inches='tight', pad_inches=0.1)
+    
+        print(f"Chart saved as: {output_filename}")
+    
+        # Show the plot
+        plt.show()
 
 def main():
     """
@@ -196,12 +174,12 @@ def main():
     
     try:
         # Read data
-        headers, data_dict = read_csv_data(filename)
+        df = read_csv_data(filename)
         print(f"Successfully read data from {filename}")
-        print(f"Available periods: {[h for h in headers if h != 'Hour']}")
+        print(f"Available periods: {[h for h in df.columns if h != 'Hour']}")
         
         # Extract period data
-        hours, period1_data, period2_data = extract_period_data(data_dict, period1_name, period2_name)
+        hours, period1_data, period2_data = extract_period_data(df, period1_name, period2_name)
         
         # Create the chart
         create_grouped_bar_chart(hours, period1_data, period2_data, period1_name, period2_name)
@@ -5,16 +5,36 @@ time blocks. The user is prompted to input multiple time blocks (start and end)
 which are then used to aggregate the data accordingly.
 
 Usage:
-    python hourly_stacked_bar_chart.py <filename>
+    python hourly_stacked_bar_chart.py <filename> [<filename> ...]
+
+With several files, the same time blocks are used for all of them, the charts are
+drawn on one reused figure and each is saved as <csv name>_stacked_bar_chart.pdf.
 """
 import csv
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from itertools import tee
+import os
 import sys
-import statsmodels.api as sm
 import matplotlib.ticker as mticker
 
+# Style of the chart, applied while it is drawn
+STYLE = {
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'axes.grid.axis': 'y',
+    'axes.axisbelow': True,
+    'grid.linestyle': '--',
+    'grid.linewidth': 0.7,
+    'grid.alpha': 0.7,
+    'ytick.labelsize': 10,
+}
+
+# Size of the chart and the file it is saved to when a single CSV is plotted
+FIGURE = {'figsize': (6.4, 4.8), 'dpi': 100}
+OUTPUT_FILE = 'stacked_bar_chart.pdf'
+
 def block_to_time(block, is_end=False):
     """
     Convert a block index to a time string in HH:00 format. 
@@ -60,20 +80,15 @@ def read_data(filename):
     Returns:
     tuple: A tuple containing periods, hours, and period data.
     """
-    hours = []
     with open(filename) as csvfile:
         reader = csv.reader(csvfile)
         periods = next(reader)  # Skip header row
-        reader_copy1, reader_copy2, reader_copy3 = tee(reader, 3)
-        num_of_periods = len(periods)
-        period = [[] for _ in range(num_of_periods)]
+        # The first column of the remaining rows holds the hour labels
+        rows = np.loadtxt(csvfile, delimiter=',', dtype=str, ndmin=2)
 
-        for row in reader_copy2:
-            for i in range(1, len(period)):
-                period[i].append(float(row[i]))
-
-        for row in reader_copy3:
-            hours.append(row[0])
+    hours = rows[:, 0].tolist()
+    # One row per period with its value for every hourly block
+    period = rows[:, 1:].astype(float).T
 
     return periods, hours, period
 
@@ -82,7 +97,7 @@ def prepare_data(period, time_blocks):
     Prepare data for each time block and generate time labels.
 
     Parameters:
-    period (list of lists): The period data.
+    period (numpy array): The period data, one row per period and one column per hourly block.
     time_blocks (list of tuples): List of start and end block indices.
 
     Returns:
@@ -91,18 +106,20 @@ def prepare_data(period, time_blocks):
     data_blocks = []
     time_labels = []
 
+    # Running totals over the day repeated twice, so that a wrap-around block is also
+    # a contiguous range; the sum of any block is then a difference of two columns
+    period_twice = np.concatenate([period, period], axis=1)
+    prefix = np.concatenate([np.zeros((len(period), 1)), period_twice.cumsum(axis=1)], axis=1)
+
     for time_block_start, time_block_end in time_blocks:
-        data = []
-        for per in period:
-            if len(per) > 0:
-                if time_block_start == time_block_end:
-                    total = per[time_block_start]
-                elif time_block_end > time_block_start:
-                    total = sum(per[time_block_start:time_block_end])
-                else:
-                    # Wrap around case: e.g., 21 to 1 → [21:24] + [0:1]
-                    total = sum(per[time_block_start:24]) + sum(per[0:time_block_end])
-                data.append(total)
+        # Sum of the block for every period
+        if time_block_start == time_block_end:
+            data = period[:, time_block_start]
+        elif time_block_end > time_block_start:
+            data = prefix[:, time_block_end] - prefix[:, time_block_start]
+        else:
+            # Wrap around case: e.g., 21 to 1 → [21:24] + [0:1]
+            data = prefix[:, time_block_end + 24] - prefix[:, time_block_start]
         
         data_blocks.append(data)
         
@@ -112,7 +129,21 @@ def prepare_data(period, time_blocks):
 
     return np.array(data_blocks), time_labels
 
-def plot_data(data_blocks, time_labels, periods):
+def reset_axes(ax):
+    """
+    Clear a reused axes and give it the chart's style. Must be called inside
+    plt.rc_context(STYLE); spines and axisbelow are only read from rcParams when an
+    axes is created, so they are set here.
+
+    Parameters:
+    ax (matplotlib Axes): The axes to clear.
+    """
+    ax.cla()
+    ax.spines['top'].set_visible(STYLE['axes.spines.top'])
+    ax.spines['right'].set_visible(STYLE['axes.spines.right'])
+    ax.set_axisbelow(STYLE['axes.axisbelow'])
+
+def plot_data(data_blocks, time_labels, periods, ax=None, output_file=OUTPUT_FILE):
     """
     Plot a 100% stacked bar chart based on the data blocks and time labels.
 
@@ -120,59 +151,65 @@ def plot_data(data_blocks, time_labels, periods):
     data_blocks (numpy array): Array of data blocks.
     time_labels (list of str): List of time labels for the legend.
     periods (list of str): List of period labels.
+    ax (matplotlib Axes, optional): Axes to draw on, cleared first, so that a batch of
+        charts can reuse one figure. A new figure is created if not given.
+    output_file (str): Path of the PDF the chart is saved to.
     """
-    data_blocks_normalized = (data_blocks / data_blocks.sum(axis=0))*100
-
-    fig, ax = plt.subplots(figsize=(6.4, 4.8), dpi=100)
-
-    bottom = np.zeros(len(periods))
+    with plt.rc_context(STYLE):
+        data_blocks_normalized = (data_blocks / data_blocks.sum(axis=0))*100
+
+        if ax is None:
+            fig, ax = plt.subplots(**FIGURE)
+        else:
+            reset_axes(ax)
+            fig = ax.figure
+
+        # Each block is stacked on the running total of the blocks before it
+        bottoms = np.zeros_like(data_blocks_normalized)
+        bottoms[1:] = np.cumsum(data_blocks_normalized[:-1], axis=0)
     
-    # Use professional color scheme
-    colors = plt.cm.tab10(np.linspace(0, 1, len(time_labels)))
-
-    for i, data_block in enumerate(data_blocks_normalized):
-        ax.bar(range(len(periods)), data_block, bottom=bottom, color=colors[i], 
-               width=0.85, label=time_labels[i], edgecolor='white', linewidth=0.5)
-        bottom += data_block
-
-    ax.set_xlabel('Year', fontsize=12, fontname='DejaVu Serif')
-    ax.set_ylabel('Commits (%)', fontsize=12, fontname='DejaVu Serif')
+        # Use professional color scheme
+        colors = plt.cm.tab10(np.linspace(0, 1, len(time_labels)))
 
-    ax.set_xticks(range(len(periods)))
-    ax.set_xticklabels(periods, rotation=45, ha='center', fontsize=10, fontname='DejaVu Serif')
+        for i, (data_block, bottom) in enumerate(zip(data_blocks_normalized, bottoms)):
+            ax.bar(range(len(periods)), data_block, bottom=bottom, color=colors[i], 
+                   width=0.85, label=time_labels[i], edgecolor='white', linewidth=0.5)
 
-    # Format y-axis as percentages
-    ax.yaxis.set_major_formatter(mticker.PercentFormatter(decimals=0))
-    ax.tick_params(axis='y', labelsize=10)
+        ax.set_xlabel('Year', fontsize=12, fontname='DejaVu Serif')
+        ax.set_ylabel('Commits (%)', fontsize=12, fontname='DejaVu Serif')
 
-    # Professional grid
-    ax.yaxis.grid(True, linestyle='--', linewidth=0.7, alpha=0.7)
-    ax.set_axisbelow(True)
+        ax.set_xticks(range(len(periods)))
+        ax.set_xticklabels(periods, rotation=45, ha='center', fontsize=10, fontname='DejaVu Serif')
 
-    # Clean up spines
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
+        # Format y-axis as percentages
+        ax.yaxis.set_major_formatter(mticker.PercentFormatter(decimals=0))
 
-    # Professional legend
-    ax.legend(fontsize=10, loc='center right', bbox_to_anchor=(1, 0.4), 
-              facecolor='white', framealpha=1, frameon=True, edgecolor='gray')
+        # Professional legend
+        ax.legend(fontsize=10, loc='center right', bbox_to_anchor=(1, 0.4), 
+                  facecolor='white', framealpha=1, frameon=True, edgecolor='gray')
 
-    plt.tight_layout()
-    plt.savefig('stacked_bar_chart.pdf', format='pdf', bbox_inches='tight', pad_inches=0.1)
+        fig.tight_layout()
+        fig.savefig(output_file, format='pdf', bbox_inches='tight', pad_inches=0.1)
 
-def main(filename):
+def main(filenames):
     """
     Main function to execute the script workflow.
 
     Parameters:
-    filename (str): The name of the CSV file to process.
+    filenames (list of str): The names of the CSV files to process.
     """
     time_blocks = input_time_blocks()
-    periods, hours, period = read_data(filename)
-    periods = periods[1:len(periods)]
-    data_blocks, time_labels = prepare_data(period, time_blocks)
-    plot_data(data_blocks, time_labels, periods)
+    fig, ax = plt.subplots(**FIGURE)
+    for filename in filenames:
+        periods, hours, period = read_data(filename)
+        periods = periods[1:len(periods)]
+        data_blocks, time_labels = prepare_data(period, time_blocks)
+        output_file = OUTPUT_FILE
+        if len(filenames) > 1:
+            output_file = f"{os.path.splitext(os.path.basename(filename))[0]}_{OUTPUT_FILE}"
+        plot_data(data_blocks, time_labels, periods, ax=ax, output_file=output_file)
+    plt.close(fig)
 
 if __name__ == "__main__":
-    filename = sys.argv[1]
-    main(filename)
\ No newline at end of file
+    matplotlib.use('Agg')  # The charts are only saved to files
+    main(sys.argv[1:])
@@ -2,10 +2,11 @@
 Script to generate a bar chart showing total commits per period.
 
 Usage:
-    python total_commits_per_period.py <filename.csv>
+    python total_commits_per_period.py <filename.csv> [<filename.csv> ...]
 
 Arguments:
-    <filename.csv>: CSV file containing commit data.
+    <filename.csv>: CSV file containing commit data. With several files, the charts are
+        drawn on one reused figure and each is saved as <csv name>_total_commits_per_period.pdf.
 
 Returns:
     A bar chart showing the total commits per period.
@@ -17,10 +18,29 @@ Dependencies:
 """
 import csv
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+import os
 import sys
 
+# Style of the chart, applied while it is drawn
+STYLE = {
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'axes.grid.axis': 'y',
+    'axes.axisbelow': True,
+    'grid.linestyle': '--',
+    'grid.linewidth': 1.0,
+    'grid.alpha': 0.6,
+    'ytick.labelsize': 16,
+}
+
+# Size of the chart and the file it is saved to when a single CSV is plotted
+FIGURE = {'figsize': (10, 6), 'dpi': 300}
+OUTPUT_FILE = 'total_commits_per_period.pdf'
+
 def read_data(filename):
     """
     Read data from CSV file and calculate total commits per period.
@@ -46,59 +66,83 @@ def read_data(filename):
     
     return periods, total_commits
 
-def plot_total_commits(periods, total_commits):
+def reset_axes(ax):
+    """
+    Clear a reused axes and give it the chart's style. Must be called inside
+    plt.rc_context(STYLE); spines and axisbelow are only read from rcParams when an
+    axes is created, so they are set here.
+
+    Parameters:
+    ax (matplotlib Axes): The axes to clear.
+    """
+    ax.cla()
+    ax.spines['top'].set_visible(STYLE['axes.spines.top'])
+    ax.spines['right'].set_visible(STYLE['axes.spines.right'])
+    ax.set_axisbelow(STYLE['axes.axisbelow'])
+
+def plot_total_commits(periods, total_commits, ax=None, output_file=OUTPUT_FILE):
     """
     Plot total commits per period.
     
     Parameters:
     periods (list): List of period names
     total_commits (list): List of total commits for each period
+    ax (matplotlib Axes, optional): Axes to draw on, cleared first, so that a batch of
+        charts can reuse one figure. A new figure is created (and closed) if not given.
+    output_file (str): Path of the PDF the chart is saved to.
     """
-    x = np.arange(len(periods))
+    with plt.rc_context(STYLE):
+        x = np.arange(len(periods))
     
-    fig, ax = plt.subplots(figsize=(10, 6), dpi=300)
+        new_figure = ax is None
+        if new_figure:
+            fig, ax = plt.subplots(**FIGURE)
+        else:
+            reset_axes(ax)
+            fig = ax.figure
     
-    # Professional color
-    color = '#4C72B0'
+        # Professional color
+        color = '#4C72B0'
     
-    ax.bar(x, total_commits, width=0.6, color=color, 
-           edgecolor='white', linewidth=1.0)
+        ax.bar(x, total_commits, width=0.6, color=color, 
+               edgecolor='white', linewidth=1.0)
     
-    ax.set_ylabel('Total Commits (Thousands)', fontsize=18, fontname='DejaVu Serif')
-    ax.set_xlabel('Year', fontsize=18, fontname='DejaVu Serif')
+        ax.set_ylabel('Total Commits (Thousands)', fontsize=18, fontname='DejaVu Serif')
+        ax.set_xlabel('Year', fontsize=18, fontname='DejaVu Serif')
 
-    # Show all labels
-    ax.set_xticks(x)
-    ax.set_xticklabels(periods, rotation=45, ha='center', fontsize=16, fontname='DejaVu Serif')
+        # Show all labels
+        ax.set_xticks(x)
+        ax.set_xticklabels(periods, rotation=45, ha='center', fontsize=16, fontname='DejaVu Serif')
 
-    # Format y-axis to show values in thousands
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, pos: f'{int(x/1000)}'))
-    ax.tick_params(axis='y', labelsize=16)
-    
-    # Professional styling
-    ax.yaxis.grid(True, linestyle='--', linewidth=1.0, alpha=0.6)
-    ax.set_axisbelow(True)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
+        # Format y-axis to show values in thousands
+        ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, pos: f'{int(x/1000)}'))
     
-    # Optimize layout
-    plt.subplots_adjust(left=0.12, right=0.98, top=0.95, bottom=0.15)
-    plt.tight_layout(pad=0.5)
+        # Optimize layout
+        fig.subplots_adjust(left=0.12, right=0.98, top=0.95, bottom=0.15)
+        fig.tight_layout(pad=0.5)
     
-    plt.savefig('total_commits_per_period.pdf', format='pdf', 
-                bbox_inches='tight', pad_inches=0.1)
-    plt.close()
+        fig.savefig(output_file, format='pdf', 
+                    bbox_inches='tight', pad_inches=0.1)
+        if new_figure:
+            plt.close(fig)
 
 def main():
     """Main function to execute the script."""
-    if len(sys.argv) != 2:
-        print("Usage: python total_commits_per_period.py <filename.csv>")
+    if len(sys.argv) < 2:
+        print("Usage: python total_commits_per_period.py <filename.csv> [<filename.csv> ...]")
         sys.exit(1)
     
-    filename = sys.argv[1]
-    periods, total_commits = read_data(filename)
-    plot_total_commits(periods, total_commits)
-    print(f"Plot saved as 'total_commits_per_period.pdf'")
+    filenames = sys.argv[1:]
+    fig, ax = plt.subplots(**FIGURE)
+    for filename in filenames:
+        periods, total_commits = read_data(filename)
+        output_file = OUTPUT_FILE
+        if len(filenames) > 1:
+            output_file = f"{os.path.splitext(os.path.basename(filename))[0]}_{OUTPUT_FILE}"
+        plot_total_commits(periods, total_commits, ax=ax, output_file=output_file)
+        print(f"Plot saved as '{output_file}'")
+    plt.close(fig)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    matplotlib.use('Agg')  # The charts are only saved to files
+    main()
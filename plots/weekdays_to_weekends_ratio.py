@@ -18,6 +18,8 @@ Dependencies:
 Example:
     python weekdays_to_weekends_ratio.py commit_data.csv
 """
+import matplotlib
+matplotlib.use('Agg')  # The chart is only saved to a file
 import matplotlib.pyplot as plt
 import sys
 import numpy as np
@@ -29,13 +31,12 @@ filename = sys.argv[1]
 # Reading data from the CSV file
 data = pd.read_csv(filename)
 
-# Filter out the weekdays and weekends
-weekdays = data.iloc[0:5, 1:].T
-weekends = data.iloc[5:, 1:].T
+# One row per day of the week (Monday first) and one column per year
+commits = data.iloc[:, 1:].to_numpy(dtype=np.float64)
 
 # Calculate the average number of commits for weekdays and weekends
-avg_n_of_commits_weekdays = np.mean(weekdays, axis=1)
-avg_n_of_commits_weekends = np.mean(weekends, axis=1)
+avg_n_of_commits_weekdays = commits[:5].mean(axis=0)
+avg_n_of_commits_weekends = commits[5:].mean(axis=0)
 
 # Calculate the ratio of average weekday commits to average weekend commits
 ratio = avg_n_of_commits_weekdays / avg_n_of_commits_weekends
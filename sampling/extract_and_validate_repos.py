@@ -6,15 +6,35 @@ that they are still accessible on GitHub, filtering out deleted or inaccessible
 
 Input: ghs_results.csv (from SEART GitHub Search)
 Output: projects-accepted.txt (validated repo names, one per line)
+Cache: repo_check_cache.json (status code, check time and ETag of each repo checked)
 
 Requires: GH_TOKEN environment variable for GitHub API access
 """
+import json
 import os
+import random
 import time
 import requests
 import pandas as pd
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+# Number of repositories validated concurrently when a token is available
+MAX_WORKERS = 16
+
+# Repository checks are reused on reruns for a week, then revalidated with their ETag
+CACHE_FILE = "repo_check_cache.json"
+CACHE_TTL = 7 * 24 * 3600
+
+# Status codes that say whether the repository itself exists, and so can be cached;
+# anything else (401, 403, 429, 5xx, ...) depends on the token or the API at that moment
+CACHEABLE_CODES = {404, 410, 451}
+
+def is_cacheable(code):
+    """Return whether a repository check with this status code can be reused on reruns."""
+    return code is not None and (200 <= code < 300 or code in CACHEABLE_CODES)
 
 def extract_and_validate_repos():
     """Extract repository names from CSV and validate they exist on GitHub."""
@@ -56,48 +76,108 @@ def extract_and_validate_repos():
     final_projects = []
     deleted_count = 0
     
-    def fetch_ok(url, retries=2):
+    # Load the status codes of the repositories checked by previous runs
+    cache = {}
+    if os.path.exists(CACHE_FILE):
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+    
+    # A shared session keeps the connections to the API alive between requests
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    
+    def backoff(attempt):
+        """Return the wait before the next retry: 0.5s, 1s, 2s, ... plus some jitter."""
+        return 0.5 * 2 ** attempt + random.random() * 0.1
+    
+    def fetch_ok(url, headers=None, retries=2):
         """Fetch URL with retry logic."""
         for i in range(retries + 1):
             try:
-                resp = requests.get(url, headers=HEADERS)
+                # Only the status code is used, so HEAD is enough; redirects are followed
+                # so that renamed repositories stay valid
+                resp = session.head(url, headers=headers, allow_redirects=True)
             except requests.RequestException as e:
                 if i < retries:
-                    time.sleep(1)
+                    time.sleep(backoff(i))
                     continue
                 print(f"[ERROR] Network failure for {url}: {e}")
                 return None
+            if resp.status_code in (403, 429) and i < retries:
+                # Rate limited: wait until GitHub accepts requests again, then retry
+                if "Retry-After" in resp.headers:
+                    time.sleep(int(resp.headers["Retry-After"]) + random.random())
+                    continue
+                if resp.headers.get("X-RateLimit-Remaining") == "0":
+                    reset = int(resp.headers.get("X-RateLimit-Reset", 0))
+                    time.sleep(max(0, reset - time.time()) + random.random())
+                    continue
             if resp.status_code >= 500 and i < retries:
-                time.sleep(1)
+                time.sleep(backoff(i))
                 continue
             return resp
         return None
     
-    for i, proj in enumerate(repo_names, 1):
-        if i % 100 == 0:
-            print(f"Progress: {i}/{len(repo_names)} repositories checked")
-        
-        url = f"https://api.github.com/repos/{proj}"
-        resp = fetch_ok(url)
+    def check(proj):
+        """Return a repository with its status code, or None if it could not be fetched."""
+        etag = None
+        if proj in cache:
+            code, checked, etag = cache[proj]
+            if is_cacheable(code) and time.time() - checked < CACHE_TTL:
+                return proj, code
         
-        if not resp or not resp.ok:
-            code = resp.status_code if resp else "N/A"
-            print(f"[REMOVED] {proj} (Status: {code})")
-            deleted_count += 1
-            continue
-        
-        final_projects.append(proj)
+        # An expired entry is revalidated with its ETag; an unchanged repository then answers
+        # 304 Not Modified, which does not count against the rate limit
+        headers = {"If-None-Match": etag} if etag else None
+        resp = fetch_ok(f"https://api.github.com/repos/{proj}", headers)
+        code = resp.status_code if resp is not None else None
+        if code == 304:
+            code = cache[proj][0]
+        elif resp is not None:
+            etag = resp.headers.get("ETag")
+        if is_cacheable(code):
+            cache[proj] = [code, time.time(), etag]
         
         # Basic rate limiting
         if not TOKEN:  # Unauthenticated requests have lower limits
             time.sleep(0.1)
+        return proj, code
+    
+    def save_cache():
+        """Write the cache through a temporary file, so an interrupted write keeps the old one."""
+        with open(CACHE_FILE + ".tmp", "w") as f:
+            json.dump(dict(cache), f)
+        os.replace(CACHE_FILE + ".tmp", CACHE_FILE)
+    
+    # Unauthenticated requests are made one at a time
+    workers = MAX_WORKERS if TOKEN else 1
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # map yields the results in input order, so the output file keeps the CSV order
+        for i, (proj, code) in enumerate(executor.map(check, repo_names), 1):
+            if i % 100 == 0:
+                print(f"Progress: {i}/{len(repo_names)} repositories checked")
+                save_cache()
+            
+            if code is None or code >= 400:
+                print(f"[REMOVED] {proj} (Status: {code if code is not None else 'N/A'})")
+                deleted_count += 1
+                continue
+            
+            final_projects.append(proj)
+    finally:
+        # Checks already running are finished and the pending ones dropped, so that an
+        # interrupted run keeps every result it got for the next run
+        executor.shutdown(cancel_futures=True)
+        save_cache()
     
     # Step 3: Save validated repositories
     print(f"\nStep 3: Saving validated repositories...")
     
     with open("projects-accepted.txt", "w") as out:
-        for p in final_projects:
-            out.write(p + "\\n")
+        out.write("".join(f"{p}\n" for p in final_projects))
     
     print(f"✓ Validation complete!")
     print(f"  • Original repositories: {len(repo_names)}")
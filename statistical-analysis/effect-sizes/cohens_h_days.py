@@ -7,6 +7,7 @@ It then calculates Cohen's h to quantify the difference in commit percentages be
 
 Usage:
     python cohens_h_days.py <filename.csv> <first_period> <second_period> <day_of_week>
+    python cohens_h_days.py <filename.csv> --all
 
 Cohen's h is interpreted as:
 - Small effect size if h < 0.2
@@ -18,6 +19,8 @@ Arguments:
 - period1: The first time period to compare.
 - period2: The second time period to compare.
 - day: The day of the week for which the comparison is to be made.
+- --all: Instead of a single comparison, write Cohen's h for every day and every pair of
+  periods to CohensHPerDay.csv.
 
 Usage example:
 python cohens_h_days.py CommitPercentagesPerDay.csv 2004 2023 Monday
@@ -26,6 +29,8 @@ import sys
 import argparse
 import csv
 import math
+import numpy as np
+import pandas as pd
 
 def calculate_cohens_h(p1, p2):
     # Convert percentages to proportions
@@ -35,7 +40,17 @@ def calculate_cohens_h(p1, p2):
     h = 2 * (math.asin(math.sqrt(p1)) - math.asin(math.sqrt(p2)))
     return h
 
-def get_commit_percentage(filename, period, day):
+def calculate_cohens_h_matrix(percentages):
+    # Cohen's h between every pair of periods of each row:
+    # h[..., i, j] compares period i with period j
+    angles = np.arcsin(np.sqrt(np.asarray(percentages) / 100))
+    return 2 * (angles[..., :, None] - angles[..., None, :])
+
+def read_csv_data(filename):
+    # One row per day of the week, one column per period
+    return pd.read_csv(filename, index_col=0, float_precision='round_trip')
+
+def get_commit_percentage(data, period, day):
     day_index = {
         'Monday': 0,
         'Tuesday': 1,
@@ -47,33 +62,51 @@ def get_commit_percentage(filename, period, day):
     }
     
     index = day_index[day]
-    with open(filename) as csvfile:
-        reader = csv.reader(csvfile)
-        header = next(reader)
-        period_index = header.index(period)
-        for row in reader:
-            if reader.line_num == index + 2:  # The data for each day starts from the second row
-                return float(row[period_index])
-    return None
+    if index >= len(data):
+        return None
+    return float(data[period].iloc[index])
+
+def write_all_cohens_h(data, filename='CohensHPerDay.csv'):
+    periods = data.columns.tolist()
+    h = calculate_cohens_h_matrix(data.to_numpy())
+
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Day', 'Period1', 'Period2', 'h'])
+        writer.writerows([day, period1, period2, float(h[d, i, j])]
+                         for d, day in enumerate(data.index)
+                         for i, period1 in enumerate(periods)
+                         for j, period2 in enumerate(periods))
+    print(f"Cohen's h for every day and pair of periods written to {filename}")
 
 def main():
     parser = argparse.ArgumentParser(description="A script for calculating Cohen's h between two time periods for a specific day")
     
     parser.add_argument("filename", help="The CSV file to get the data from")
-    parser.add_argument("period1", help="The first time period")
-    parser.add_argument("period2", help="The second time period")
-    parser.add_argument("day", help="The day of the week")
+    parser.add_argument("period1", nargs='?', help="The first time period")
+    parser.add_argument("period2", nargs='?', help="The second time period")
+    parser.add_argument("day", nargs='?', help="The day of the week")
+    parser.add_argument("--all", action='store_true',
+                        help="Write Cohen's h for every day and pair of periods to a CSV")
     
     args = parser.parse_args()
     
+    if args.all:
+        write_all_cohens_h(read_csv_data(args.filename))
+        return
+    if args.day is None:
+        parser.error("period1, period2 and day are required unless --all is given")
+    
     filename = args.filename
     period1 = args.period1
     period2 = args.period2
     day = args.day
     
+    data = read_csv_data(filename)
+    
     # Get commit percentages for the specified periods and day
-    p1 = get_commit_percentage(filename, period1, day)
-    p2 = get_commit_percentage(filename, period2, day)
+    p1 = get_commit_percentage(data, period1, day)
+    p2 = get_commit_percentage(data, period2, day)
     
     if p1 is None or p2 is None:
         print("Error: Unable to find data for the specified periods and day.")
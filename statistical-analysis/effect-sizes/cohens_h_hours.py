@@ -8,6 +8,7 @@ between these years.
 
 Usage:
     python cohens_h_hours.py <filename.csv> <start_hour> <end_hour> <first_period> <second_period>
+    python cohens_h_hours.py <filename.csv> <start_hour> <end_hour> --all
 
 Cohen's h is interpreted as:
 - Small effect size if h < 0.2
@@ -20,6 +21,8 @@ Arguments:
 - end_hour: The ending hour of the time block (24-hour format).
 - year1: The first year to compare.
 - year2: The second year to compare.
+- --all: Instead of a single comparison, write Cohen's h of the hour block for every pair of
+  years to CohensHPerHourBlock.csv.
 
 Usage example:
 python cohens_h_hours.py CommitPercentagesPerHour.csv 9 17 2015 2024
@@ -28,6 +31,8 @@ import sys
 import argparse
 import csv
 import math
+import numpy as np
+import pandas as pd
 
 def calculate_cohens_h(p1, p2):
     # Convert percentages to proportions
@@ -37,26 +42,46 @@ def calculate_cohens_h(p1, p2):
     h = 2 * (math.asin(math.sqrt(p1)) - math.asin(math.sqrt(p2)))
     return h
 
-def get_commit_percentage_sum(filename, year, start_hour, end_hour):
-    with open(filename) as csvfile:
-        reader = csv.reader(csvfile)
-        header = next(reader)
-        year_index = header.index(str(year))
-        start_hour = int(start_hour)
-        end_hour = int(end_hour)
-        
-        total_commits = 0
-
-        for row in reader:
-            hour = int(row[0].split(':')[0])
-            if start_hour <= end_hour:
-                if start_hour <= hour < end_hour:
-                    total_commits += float(row[year_index])
-            else:
-                if hour >= start_hour or hour < end_hour:
-                    total_commits += float(row[year_index])
-
-        return total_commits
+def calculate_cohens_h_matrix(percentages):
+    # Cohen's h between every pair of periods of each row:
+    # h[..., i, j] compares period i with period j
+    angles = np.arcsin(np.sqrt(np.asarray(percentages) / 100))
+    return 2 * (angles[..., :, None] - angles[..., None, :])
+
+def read_csv_data(filename):
+    # One row per hour (labelled HH:MM), one column per year
+    return pd.read_csv(filename, index_col=0, float_precision='round_trip')
+
+def get_hour_block(data, start_hour, end_hour):
+    # Select the rows from start_hour up to, but excluding, end_hour, wrapping around midnight
+    start_hour = int(start_hour)
+    end_hour = int(end_hour)
+    hours = data.index.map(lambda label: int(label.split(':')[0]))
+
+    if start_hour <= end_hour:
+        return (hours >= start_hour) & (hours < end_hour)
+    else:
+        return (hours >= start_hour) | (hours < end_hour)
+
+def get_commit_percentage_sum(data, year, start_hour, end_hour):
+    in_block = get_hour_block(data, start_hour, end_hour)
+
+    # Add the hours up one by one in file order, so the total is the same as a running sum
+    return sum(data.loc[in_block, str(year)].tolist())
+
+def write_all_cohens_h(data, start_hour, end_hour, filename='CohensHPerHourBlock.csv'):
+    years = data.columns.tolist()
+    # Summing down the columns adds each year's hours in file order, as above
+    totals = data.loc[get_hour_block(data, start_hour, end_hour)].to_numpy().sum(axis=0)
+    h = calculate_cohens_h_matrix(totals)
+
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Year1', 'Year2', 'h'])
+        writer.writerows([year1, year2, float(h[i, j])]
+                         for i, year1 in enumerate(years)
+                         for j, year2 in enumerate(years))
+    print(f"Cohen's h for {start_hour}:00 to {end_hour}:00 and every pair of years written to {filename}")
 
 def main():
     parser = argparse.ArgumentParser(description="A script for calculating Cohen's h between two time periods for a specific hour block")
@@ -64,20 +89,30 @@ def main():
     parser.add_argument("filename", help="The CSV file to get the data from")
     parser.add_argument("start_hour", help="The starting hour (24-hour format)")
     parser.add_argument("end_hour", help="The ending hour (24-hour format)")
-    parser.add_argument("year1", help="The first year")
-    parser.add_argument("year2", help="The second year")
+    parser.add_argument("year1", nargs='?', help="The first year")
+    parser.add_argument("year2", nargs='?', help="The second year")
+    parser.add_argument("--all", action='store_true',
+                        help="Write Cohen's h of the hour block for every pair of years to a CSV")
     
     args = parser.parse_args()
     
+    if args.all:
+        write_all_cohens_h(read_csv_data(args.filename), args.start_hour, args.end_hour)
+        return
+    if args.year2 is None:
+        parser.error("year1 and year2 are required unless --all is given")
+    
     filename = args.filename
     start_hour = args.start_hour
     end_hour = args.end_hour
     year1 = args.year1
     year2 = args.year2
     
+    data = read_csv_data(filename)
+    
     # Get commit percentages for the specified years and hour block
-    p1 = get_commit_percentage_sum(filename, year1, start_hour, end_hour)
-    p2 = get_commit_percentage_sum(filename, year2, start_hour, end_hour)
+    p1 = get_commit_percentage_sum(data, year1, start_hour, end_hour)
+    p2 = get_commit_percentage_sum(data, year2, start_hour, end_hour)
     
     if p1 is None or p2 is None:
         print("Error: Unable to find data for the specified periods and hour block.")
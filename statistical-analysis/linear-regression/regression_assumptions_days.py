@@ -26,7 +26,6 @@ python regression_assumptions_days.py CommitCountsPerDay.csv 3
 Where `3` corresponds to the day of the week (days are indexed from 0=Monday).
 """
 import csv
-from itertools import tee
 import numpy as np
 import sys
 import argparse
@@ -34,7 +33,6 @@ import statsmodels.api as sm
 import matplotlib.pyplot as plt
 import statsmodels.stats.api as sms
 import scipy.stats as stats
-import statsmodels.api as sm
 
 parser = argparse.ArgumentParser(description="A script for checking if linear regression assumptions are meeted for a set of data")
 
@@ -44,33 +42,15 @@ parser.add_argument("day", help="The day of the week to implement the linear reg
 filename = sys.argv[1] # The first argument is the filename
 week_day = sys.argv[2] # The second argument is the day of the week
 
-day_total = []
-all_commits = [[] for _ in range(7)]
-sum_period = []
-
-# Open the csv file and read its contents into the lists
+# Open the csv file and read its contents
 with open(filename) as csvfile:
     reader = csv.reader(csvfile)
     periods = next(reader)  # Skip header row
-    # Copy the reader
-    reader_copy1, reader_copy2 = tee(reader)
-    num_of_periods = len(periods)
-    period = [[] for _ in range(num_of_periods)]
-
-    # Append the number of commits for each day in each period
-    for row in reader_copy2:
-        for i in range(1, len(period)):
-            period[i].append(float(row[i]))
-    # Append for each week day the number of commits for every period
-    for i in range(len(period[1])):
-        total_commits = 0
-        for j in range(1, len(period)):
-            all_commits[i].append(period[j][i]) # Calculate the total number of commits for each day
-            total_commits += period[j][i]
-        day_total.append(total_commits)
-    # Calculate total commits for each period
-    for i in range(1, len(period)):
-        sum_period.append(sum(period[i]))
+    # The first column holds the day labels, so only the period columns are loaded
+    commits = np.loadtxt(csvfile, delimiter=',', usecols=range(1, len(periods)), ndmin=2)
+
+# Each row holds the number of commits of one week day for every period
+all_commits = list(commits)
 
 per = range(1, len(periods))
 periods = periods[1:len(periods)]
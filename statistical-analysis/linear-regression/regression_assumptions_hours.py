@@ -26,7 +26,6 @@ python regression_assumptions_hours.py CommitCountsPerHour.csv 10
 Where `10` refers to the 10th hourly block in the data (10 AM).
 """
 import csv
-from itertools import tee
 import numpy as np
 import sys
 import argparse
@@ -34,35 +33,19 @@ import statsmodels.api as sm
 import matplotlib.pyplot as plt
 import statsmodels.stats.api as sms
 import scipy.stats as stats
-import statsmodels.api as sm
 
 filename = sys.argv[1] # The first argument is the file name
 time_block = int(sys.argv[2]) # The second argument is the time block to keep for the linear regression assumptions check
 
-hours = []
-
-# Open the csv file and read its contents into the lists
+# Open the csv file and read its contents
 with open(filename) as csvfile:
     reader = csv.reader(csvfile)
     periods = next(reader)  # Skip header row
-    # Copy the reader
-    reader_copy1, reader_copy2, reader_copy3 = tee(reader, 3)
-    num_of_periods = len(periods)
-    period = [[] for _ in range(num_of_periods)]
-
-    for row in reader_copy2:
-        for i in range(1, len(period)):
-            period[i].append(float(row[i]))
-
-    # Split day in 1-hour blocks
-    for row in reader_copy3:
-        hours.append(row[0])
-
-data = []
+    # The first column holds the hour labels, so only the period columns are loaded
+    commits = np.loadtxt(csvfile, delimiter=',', usecols=range(1, len(periods)), ndmin=2)
 
-for per in period:
-    if len(per) > 0:
-        data.append(per[time_block])
+# Each row holds the frequencies of one 1-hour block for every period
+data = commits[time_block]
 
 p = range(len(periods) - 1)
 
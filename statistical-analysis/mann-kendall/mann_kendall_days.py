@@ -20,8 +20,8 @@ Arguments:
 """
 import pymannkendall as mk
 import argparse
-from itertools import tee
 import csv
+import numpy as np
 import matplotlib.pyplot as plt
 
 def parse_arguments():
@@ -45,33 +45,18 @@ def read_csv_data(filename):
 
     Returns:
         list: A list containing the period labels (years).
-        list: A list of lists where each sublist contains commits for each weekday across periods.
-        list: A list of the total number of commits for each period.
+        list: A list of arrays where each array contains commits for each weekday across periods.
+        numpy.ndarray: The total number of commits for each period.
     """
-    day_total = []
-    all_commits = [[] for _ in range(7)]
-    sum_period = []
-
     with open(filename) as csvfile:
         reader = csv.reader(csvfile)
         periods = next(reader)  # Skip header row
-        reader_copy1, reader_copy2 = tee(reader)
-        num_of_periods = len(periods)
-        period = [[] for _ in range(num_of_periods)]
-
-        for row in reader_copy2:
-            for i in range(1, len(period)):
-                period[i].append(float(row[i]))
-
-        for i in range(len(period[1])):
-            total_commits = 0
-            for j in range(1, len(period)):
-                all_commits[i].append(period[j][i])
-                total_commits += period[j][i]
-            day_total.append(total_commits)
+        # The first column holds the day labels, so only the period columns are loaded
+        data = np.loadtxt(csvfile, delimiter=',', usecols=range(1, len(periods)), ndmin=2)
 
-        for i in range(1, len(period)):
-            sum_period.append(sum(period[i]))
+    # One row per weekday with its commits across periods, and the column totals per period
+    all_commits = list(data)
+    sum_period = data.sum(axis=0)
 
     periods = periods[1:len(periods)]
     return periods, all_commits, sum_period
@@ -129,8 +114,7 @@ def plot_data(periods, data, p_value, alpha=0.05):
     ax.set_xticks(range(len(periods)))
     ax.set_xticklabels(periods, rotation=45)
 
-    for label in (ax.get_xticklabels() + ax.get_yticklabels()):
-        label.set_fontsize(35)
+    ax.tick_params(axis='both', labelsize=35)
 
     if p_value < alpha:
         plt.plot(periods, data, marker='o', linestyle='-', color='red', label='Trend Line', linewidth=5, markersize=15)
@@ -22,9 +22,7 @@ import pymannkendall as mk
 import csv
 import numpy as np
 import matplotlib.pyplot as plt
-from itertools import tee
 import sys
-import statsmodels.api as sm
 
 def parse_arguments():
     """
@@ -53,24 +51,17 @@ def read_csv_data(filename):
         tuple: A tuple containing:
             - periods (list): The list of period labels (e.g., years).
             - hours (list): The list of hour blocks.
-            - period_data (list of lists): Data where each sublist contains commits for each time block.
+            - period_data (numpy array): Data where each row contains commits for each time block.
     """
-    hours = []
-    period_data = []
-
     with open(filename) as csvfile:
         reader = csv.reader(csvfile)
         periods = next(reader)  # Skip header row
-        reader_copy1, reader_copy2, reader_copy3 = tee(reader, 3)
-        num_of_periods = len(periods)
-        period = [[] for _ in range(num_of_periods)]
-
-        for row in reader_copy2:
-            for i in range(1, len(period)):
-                period[i].append(float(row[i]))
+        # The first column of the remaining rows holds the hour labels
+        rows = np.loadtxt(csvfile, delimiter=',', dtype=str, ndmin=2)
 
-        for row in reader_copy3:
-            hours.append(row[0])
+    hours = rows[:, 0].tolist()
+    # One row per period with its value for every hourly block
+    period = rows[:, 1:].astype(float).T
 
     return periods[1:], hours, period
 
@@ -79,7 +70,7 @@ def process_data(period, time_block_start, time_block_end):
     Process commit data to compute totals for specified time blocks.
 
     Args:
-        period (list of lists): Data where each sublist contains commits for each time block.
+        period (numpy array): Data where each row contains commits for each time block.
         time_block_start (int): The starting time block for analysis.
         time_block_end (int): The ending time block for analysis.
 
@@ -89,15 +80,14 @@ def process_data(period, time_block_start, time_block_end):
     data = []
 
     for per in period:
-        if len(per) > 0:
-            if time_block_start == time_block_end:
-                total = per[time_block_start]
-            elif time_block_end > time_block_start:
-                total = sum(per[time_block_start:time_block_end + 1])
-            else:
-                # Wrap around case (e.g., 23 to 3): [23:24] + [0:4]
-                total = sum(per[time_block_start:24]) + sum(per[0:time_block_end + 1])
-            data.append(total)
+        if time_block_start == time_block_end:
+            total = per[time_block_start]
+        elif time_block_end > time_block_start:
+            total = sum(per[time_block_start:time_block_end + 1])
+        else:
+            # Wrap around case (e.g., 23 to 3): [23:24] + [0:4]
+            total = sum(per[time_block_start:24]) + sum(per[0:time_block_end + 1])
+        data.append(total)
 
     return data
 
@@ -157,8 +147,7 @@ def plot_data(periods, data, p_value, alpha=0.05):
     plt.xticks(rotation=35)
 
     # Set tick font size
-    for label in (ax.get_xticklabels() + ax.get_yticklabels()):
-        label.set_fontsize(35)
+    ax.tick_params(axis='both', labelsize=35)
 
     # Display the trend line if exists
     if p_value < alpha:
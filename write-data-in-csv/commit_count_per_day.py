@@ -7,7 +7,10 @@ Usage:
     python commit_count_per_day.py <start_year> <end_year> <interval> <contents> <repos> <repos_path>
 """
 from collections import defaultdict
+from functools import partial
 from git import Repo
+from multiprocessing import Pool
+from time import gmtime
 import argparse
 import csv
 import os
@@ -18,7 +21,7 @@ def parse_arguments():
 
     Returns:
         args (argparse.Namespace): Parsed arguments containing start_year, end_year,
-        interval, contents, repos, and repos_path.
+        interval, contents, repos, repos_path and numprocesses.
     """
     parser = argparse.ArgumentParser(description='Creates a CSV containing commit count per day of the week '
                                                  'for a given interval and repository')
@@ -29,6 +32,8 @@ def parse_arguments():
                         help='The contents of the CSV (proportions or total)')
     parser.add_argument('repos', type=str, help='File containing repository names')
     parser.add_argument('repos_path', type=str, help='The path for the file that contains the cloned repos')
+    parser.add_argument('--numprocesses', type=int, default=os.cpu_count(),
+                        help='The number of repositories processed in parallel (default: number of CPUs)')
     args = parser.parse_args()
 
     # Handle invalid arguments for start and end year
@@ -39,6 +44,9 @@ def parse_arguments():
     if args.interval <= 0:
         parser.error("Invalid argument: interval must be a positive integer")
 
+    if args.numprocesses <= 0:
+        parser.error("Invalid argument: numprocesses must be a positive integer")
+
     return args
 
 def read_repo_list(repo_file):
@@ -52,9 +60,50 @@ def read_repo_list(repo_file):
         list: A list of repository names.
     """
     with open(repo_file, 'r') as file:
-        return [line.strip() for line in file.readlines()]
+        return [line.strip() for line in file]
 
-def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_periods):
+def count_repo_commits(repository, repos_path, start_year, end_year, interval, num_of_periods):
+    """
+    Count the number of commits per day of the week for a single repository.
+
+    Args:
+        repository (str): The repository name.
+        repos_path (str): The path to the directory containing the repositories.
+        start_year (int): The starting year for the commit counting.
+        end_year (int): The last year for the commit counting.
+        interval (int): The number of years in each interval.
+        num_of_periods (int): The total number of periods calculated.
+
+    Returns:
+        list: The commit counts of each interval, one list per day.
+    """
+    repo_commit_counts = [[0] * num_of_periods for _ in range(7)]
+    non_utc0_commits = set()
+    print(f"Processing repository: {repository}")
+    repo_path = os.path.join(repos_path, repository)
+    repo = Repo(repo_path)
+
+    # One '<e-mail>\t<timestamp> <+hhmm>' line per commit in the counted years, oldest first
+    log = repo.git.log('--reverse', f'--since={start_year-1}-12-31', f'--until={end_year+1}-01-01',
+                       '--date=raw', '--pretty=format:%ae%x09%ad', as_process=True)
+    for line in log.stdout:
+        contributor, date = line.decode('utf-8', 'replace').rstrip('\n').split('\t')
+        timestamp, timezone = date.split(' ')
+        if timezone != "+0000":
+            non_utc0_commits.add(contributor)
+
+        if contributor in non_utc0_commits:
+            offset = (int(timezone[1:3]) * 3600 + int(timezone[3:5]) * 60) * (-1 if timezone[0] == '-' else 1)
+            authored_time = gmtime(int(timestamp) + offset)
+            day_index = authored_time.tm_wday
+            interval_index = (authored_time.tm_year - start_year) // interval
+            if 0 <= interval_index < num_of_periods:
+                repo_commit_counts[day_index][interval_index] += 1
+    log.wait()
+
+    return repo_commit_counts
+
+def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_periods, numprocesses):
     """
     Count the number of commits per day of the week for each repository.
 
@@ -65,6 +114,7 @@ def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_
         end_year (int): The last year for the commit counting.
         interval (int): The number of years in each interval.
         num_of_periods (int): The total number of periods calculated.
+        numprocesses (int): The number of repositories processed in parallel.
 
     Returns:
         tuple: A tuple containing:
@@ -73,29 +123,19 @@ def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_
     """
     combined_commit_counts = defaultdict(lambda: [0] * num_of_periods)
     individual_commit_counts = {}
-    days_of_week = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-
-    for repository in repo_list:
-        repo_commit_counts = defaultdict(lambda: [0] * num_of_periods)
-        non_utc0_commits = defaultdict(bool)
-        print(f"Processing repository: {repository}")
-        repo_path = os.path.join(repos_path, repository)
-        repo = Repo(repo_path)
-
-        for commit in repo.iter_commits(reverse=True, since=f"{start_year-1}-12-31", until=f"{end_year+1}-01-01"):
-            contributor = commit.author.email
-            if commit.authored_datetime.strftime('%z') != "+0000":
-                non_utc0_commits[contributor] = True
 
-            if non_utc0_commits[contributor]:
-                day_index = commit.authored_datetime.weekday()
-                interval_index = (commit.authored_datetime.year - start_year) // interval
-                if 0 <= interval_index < num_of_periods:
-                    # Add to both combined and individual counts
-                    combined_commit_counts[day_index][interval_index] += 1
-                    repo_commit_counts[day_index][interval_index] += 1
+    count_repo = partial(count_repo_commits, repos_path=repos_path, start_year=start_year,
+                         end_year=end_year, interval=interval, num_of_periods=num_of_periods)
+    with Pool(processes=numprocesses) as pool:
+        # imap yields the counts in repository order
+        for repository, repo_commit_counts in zip(repo_list, pool.imap(count_repo, repo_list)):
+            # Add the repository's counts to the combined counts
+            for day_index, counts in enumerate(repo_commit_counts):
+                combined_counts = combined_commit_counts[day_index]
+                for interval_index, count in enumerate(counts):
+                    combined_counts[interval_index] += count
 
-        individual_commit_counts[repository] = repo_commit_counts
+            individual_commit_counts[repository] = repo_commit_counts
 
     return combined_commit_counts, individual_commit_counts
 
@@ -118,8 +158,8 @@ def write_counts(args, commit_counts, days_of_week, filename_prefix="CommitCount
         header_row = generate_header_row(args.start_year, args.end_year, args.interval)
         writer.writerow(header_row)
 
-        for day_index, day in enumerate(days_of_week):
-            writer.writerow([day] + [str(count) for count in commit_counts[day_index]])
+        writer.writerows([day] + [str(count) for count in commit_counts[day_index]]
+                         for day_index, day in enumerate(days_of_week))
     print(f"Commit counts written to {filename}")
     return filename
 
@@ -143,14 +183,13 @@ def write_proportions(args, commit_counts, days_of_week, num_of_periods, filenam
         header_row = generate_header_row(args.start_year, args.end_year, args.interval)
         writer.writerow(header_row)
 
-        for day_index, day in enumerate(days_of_week):
-            percentages = []
-            for interval in range(num_of_periods):
-                total_commits_interval = sum(commit_counts[other_day][interval] for other_day in range(len(days_of_week)))
-                percentage = (commit_counts[day_index][interval] / total_commits_interval * 100 
-                              if total_commits_interval != 0 else 0)
-                percentages.append(percentage)
-            writer.writerow([day] + percentages)
+        # Total commits of each interval
+        interval_totals = [sum(commit_counts[other_day][interval] for other_day in range(len(days_of_week)))
+                           for interval in range(num_of_periods)]
+        writer.writerows([day] + [(commit_counts[day_index][interval] / total_commits_interval * 100
+                                   if total_commits_interval != 0 else 0)
+                                  for interval, total_commits_interval in enumerate(interval_totals)]
+                         for day_index, day in enumerate(days_of_week))
     print(f"Commit proportions written to {filename}")
     return filename
 
@@ -213,7 +252,8 @@ def main():
     
     # Get both combined and individual commit counts
     combined_commit_counts, individual_commit_counts = count_commits(
-        repo_list, args.repos_path, args.start_year, args.end_year, args.interval, num_of_periods
+        repo_list, args.repos_path, args.start_year, args.end_year, args.interval, num_of_periods,
+        args.numprocesses
     )
 
     # Write combined results (original functionality)
@@ -7,7 +7,10 @@ Usage:
     python commit_count_per_hour.py <start_year> <end_year> <interval> <contents> <repos> <repos_path>
 """
 from collections import defaultdict
+from functools import partial
 from git import Repo
+from multiprocessing import Pool
+from time import gmtime
 import argparse
 import csv
 import os
@@ -19,7 +22,7 @@ def parse_arguments():
 
     Returns:
         argparse.Namespace: Parsed arguments containing start_year, end_year,
-        interval, contents, repos, and repos_path.
+        interval, contents, repos, repos_path and numprocesses.
     """
     parser = argparse.ArgumentParser(description='Creates a CSV containing the commit count per hour '
                                                  'for a given interval and repository')
@@ -30,6 +33,8 @@ def parse_arguments():
                         help='The contents of the CSV (proportions or total)')
     parser.add_argument('repos', type=str, help='File containing repository names')
     parser.add_argument('repos_path', type=str, help='The path for the file that contains the cloned repos')
+    parser.add_argument('--numprocesses', type=int, default=os.cpu_count(),
+                        help='The number of repositories processed in parallel (default: number of CPUs)')
     args = parser.parse_args()
 
     # Validate arguments
@@ -38,6 +43,9 @@ def parse_arguments():
     if args.interval <= 0:
         parser.error("Invalid argument: interval must be a positive integer")
 
+    if args.numprocesses <= 0:
+        parser.error("Invalid argument: numprocesses must be a positive integer")
+
     return args
 
 def read_repo_list(repo_file):
@@ -51,9 +59,50 @@ def read_repo_list(repo_file):
         list: A list of repository names.
     """
     with open(repo_file, 'r') as file:
-        return [line.strip() for line in file.readlines()]
+        return [line.strip() for line in file]
+
+def count_repo_commits(repository, repos_path, start_year, end_year, interval, num_of_periods):
+    """
+    Count the number of commits per hour for a single repository.
+
+    Args:
+        repository (str): The repository name.
+        repos_path (str): The path to the directory containing the repositories.
+        start_year (int): The starting year for the commit counting.
+        end_year (int): The last year for the commit counting.
+        interval (int): The number of years in each interval.
+        num_of_periods (int): The total number of periods calculated.
 
-def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_periods):
+    Returns:
+        list: The commit counts of each interval, one list per hour.
+    """
+    repo_commit_counts = [[0] * num_of_periods for _ in range(24)]
+    non_utc0_commits = set()
+    print(f"Processing repository: {repository}")
+    repo_path = os.path.join(repos_path, repository)
+    repo = Repo(repo_path)
+
+    # One '<e-mail>\t<timestamp> <+hhmm>' line per commit in the counted years, oldest first
+    log = repo.git.log('--reverse', f'--since={start_year-1}-12-31', f'--until={end_year+1}-01-01',
+                       '--date=raw', '--pretty=format:%ae%x09%ad', as_process=True)
+    for line in log.stdout:
+        contributor, date = line.decode('utf-8', 'replace').rstrip('\n').split('\t')
+        timestamp, timezone = date.split(' ')
+        if timezone != "+0000":
+            non_utc0_commits.add(contributor)
+
+        if contributor in non_utc0_commits:
+            offset = (int(timezone[1:3]) * 3600 + int(timezone[3:5]) * 60) * (-1 if timezone[0] == '-' else 1)
+            authored_time = gmtime(int(timestamp) + offset)
+            hour_index = authored_time.tm_hour
+            interval_index = (authored_time.tm_year - start_year) // interval
+            if 0 <= interval_index < num_of_periods:
+                repo_commit_counts[hour_index][interval_index] += 1
+    log.wait()
+
+    return repo_commit_counts
+
+def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_periods, numprocesses):
     """
     Count the number of commits per hour for each repository.
 
@@ -64,6 +113,7 @@ def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_
         end_year (int): The last year for the commit counting.
         interval (int): The number of years in each interval.
         num_of_periods (int): The total number of periods calculated.
+        numprocesses (int): The number of repositories processed in parallel.
 
     Returns:
         tuple: A tuple containing:
@@ -73,27 +123,18 @@ def count_commits(repo_list, repos_path, start_year, end_year, interval, num_of_
     combined_commit_counts = defaultdict(lambda: [0] * num_of_periods)
     individual_commit_counts = {}
 
-    for repository in repo_list:
-        repo_commit_counts = defaultdict(lambda: [0] * num_of_periods)
-        non_utc0_commits = defaultdict(bool)
-        print(f"Processing repository: {repository}")
-        repo_path = os.path.join(repos_path, repository)
-        repo = Repo(repo_path)
-
-        for commit in repo.iter_commits(reverse=True, since=f"{start_year-1}-12-31", until=f"{end_year+1}-01-01"):
-            contributor = commit.author.email
-            if commit.authored_datetime.strftime('%z') != "+0000":
-                non_utc0_commits[contributor] = True
-
-            if non_utc0_commits[contributor]:
-                hour_index = commit.authored_datetime.hour
-                interval_index = (commit.authored_datetime.year - start_year) // interval
-                if 0 <= interval_index < num_of_periods:
-                    # Add to both combined and individual counts
-                    combined_commit_counts[hour_index][interval_index] += 1
-                    repo_commit_counts[hour_index][interval_index] += 1
+    count_repo = partial(count_repo_commits, repos_path=repos_path, start_year=start_year,
+                         end_year=end_year, interval=interval, num_of_periods=num_of_periods)
+    with Pool(processes=numprocesses) as pool:
+        # imap yields the counts in repository order
+        for repository, repo_commit_counts in zip(repo_list, pool.imap(count_repo, repo_list)):
+            # Add the repository's counts to the combined counts
+            for hour_index, counts in enumerate(repo_commit_counts):
+                combined_counts = combined_commit_counts[hour_index]
+                for interval_index, count in enumerate(counts):
+                    combined_counts[interval_index] += count
 
-        individual_commit_counts[repository] = repo_commit_counts
+            individual_commit_counts[repository] = repo_commit_counts
 
     return combined_commit_counts, individual_commit_counts
 
@@ -133,8 +174,8 @@ def write_counts(args, commit_counts, filename_prefix="CommitCountsPerHour"):
         header_row = generate_header_row(args.start_year, args.end_year, args.interval)
         writer.writerow(header_row)
 
-        for hour_index, hour in enumerate(hours):
-            writer.writerow([hour.strftime('%H:%M')] + [str(count) for count in commit_counts[hour_index]])
+        writer.writerows([hour.strftime('%H:%M')] + [str(count) for count in commit_counts[hour_index]]
+                         for hour_index, hour in enumerate(hours))
     print(f"Commit counts written to {filename}")
     return filename
 
@@ -158,14 +199,13 @@ def write_proportions(args, commit_counts, num_of_periods, filename_prefix="Comm
         header_row = generate_header_row(args.start_year, args.end_year, args.interval)
         writer.writerow(header_row)
 
-        for hour_index, hour in enumerate(hours):
-            percentages = []
-            for interval in range(num_of_periods):
-                total_commits_interval = sum(commit_counts[other_hour][interval] for other_hour in range(24))
-                percentage = (commit_counts[hour_index][interval] / total_commits_interval * 100 
-                              if total_commits_interval != 0 else 0)
-                percentages.append(percentage)
-            writer.writerow([hour.strftime('%H:%M')] + percentages)
+        # Total commits of each interval
+        interval_totals = [sum(commit_counts[other_hour][interval] for other_hour in range(24))
+                           for interval in range(num_of_periods)]
+        writer.writerows([hour.strftime('%H:%M')] + [(commit_counts[hour_index][interval] / total_commits_interval * 100
+                                                      if total_commits_interval != 0 else 0)
+                                                     for interval, total_commits_interval in enumerate(interval_totals)]
+                         for hour_index, hour in enumerate(hours))
     print(f"Commit proportions written to {filename}")
     return filename
 
@@ -207,7 +247,8 @@ def main():
     
     # Get both combined and individual commit counts
     combined_commit_counts, individual_commit_counts = count_commits(
-        repo_list, args.repos_path, args.start_year, args.end_year, args.interval, num_of_periods
+        repo_list, args.repos_path, args.start_year, args.end_year, args.interval, num_of_periods,
+        args.numprocesses
     )
 
     # Write combined results (original functionality)